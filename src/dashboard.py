@@ -5,6 +5,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+import math
 import os
 
 # Page configuration
@@ -56,11 +57,17 @@ def load_data():
     if os.path.exists(db_path):
         try:
             conn = sqlite3.connect(db_path)
-            standings = pd.read_sql_query("SELECT * FROM standings", conn)
-            hitting = pd.read_sql_query("SELECT * FROM hitting_leaders", conn)
-            pitching = pd.read_sql_query("SELECT * FROM pitching_leaders", conn)
-            events = pd.read_sql_query("SELECT * FROM notable_events", conn)
-            conn.close()
+            try:
+                # One read transaction for all four tables: a single shared
+                # lock and a consistent snapshot instead of one per query
+                conn.execute("BEGIN;")
+                standings = pd.read_sql_query("SELECT * FROM standings", conn)
+                hitting = pd.read_sql_query("SELECT * FROM hitting_leaders", conn)
+                pitching = pd.read_sql_query("SELECT * FROM pitching_leaders", conn)
+                events = pd.read_sql_query("SELECT * FROM notable_events", conn)
+                conn.commit()
+            finally:
+                conn.close()
             return standings, hitting, pitching, events
         except Exception as e:
             st.warning(f"Could not load from database: {e}. Trying CSV files...")
@@ -87,21 +94,24 @@ def load_data():
     st.error("No data files found. Please run the scraper first: `python src/scraper.py`")
     return None, None, None, None
 
+# Historical context for each analyzed season
+ERA_CONTEXT = {
+    1927: {"era": "Murderers' Row", "context": "Babe Ruth's 60 HR season, Yankees dominance, Live Ball Era peak"},
+    1947: {"era": "Integration Era", "context": "Jackie Robinson breaks color barrier, post-WWII baseball resurgence"},
+    1961: {"era": "Expansion Era", "context": "Maris breaks Ruth's record, AL expands to 10 teams, 162-game season begins"},
+    1969: {"era": "End of Pitcher Era", "context": "Mound lowered, strike zone reduced, divisional play begins"},
+    1994: {"era": "Strike Season", "context": "Season ended by strike, beginning of offensive explosion"},
+    1998: {"era": "Home Run Chase", "context": "McGwire vs Sosa, offensive numbers reach historic highs"},
+    2001: {"era": "Bonds' Peak", "context": "Barry Bonds 73 HRs, post-9/11 season, steroid era continues"},
+    2016: {"era": "Analytics Era", "context": "Cubs break 108-year drought, advanced metrics reshape game"},
+    2020: {"era": "COVID Season", "context": "60-game season, DH in both leagues, empty stadiums"},
+    2023: {"era": "Modern Rules", "context": "Pitch clock, shift restrictions, larger bases implemented"}
+}
+UNKNOWN_ERA = {"era": "Unknown", "context": "No context available"}
+
 def get_era_context(year):
     """Get historical context for each era"""
-    era_info = {
-        1927: {"era": "Murderers' Row", "context": "Babe Ruth's 60 HR season, Yankees dominance, Live Ball Era peak"},
-        1947: {"era": "Integration Era", "context": "Jackie Robinson breaks color barrier, post-WWII baseball resurgence"},
-        1961: {"era": "Expansion Era", "context": "Maris breaks Ruth's record, AL expands to 10 teams, 162-game season begins"},
-        1969: {"era": "End of Pitcher Era", "context": "Mound lowered, strike zone reduced, divisional play begins"},
-        1994: {"era": "Strike Season", "context": "Season ended by strike, beginning of offensive explosion"},
-        1998: {"era": "Home Run Chase", "context": "McGwire vs Sosa, offensive numbers reach historic highs"},
-        2001: {"era": "Bonds' Peak", "context": "Barry Bonds 73 HRs, post-9/11 season, steroid era continues"},
-        2016: {"era": "Analytics Era", "context": "Cubs break 108-year drought, advanced metrics reshape game"},
-        2020: {"era": "COVID Season", "context": "60-game season, DH in both leagues, empty stadiums"},
-        2023: {"era": "Modern Rules", "context": "Pitch clock, shift restrictions, larger bases implemented"}
-    }
-    return era_info.get(year, {"era": "Unknown", "context": "No context available"})
+    return ERA_CONTEXT.get(year, UNKNOWN_ERA)
 
 def create_home_run_evolution(hitting_df):
     """Create home run evolution across eras with context"""
@@ -109,8 +119,9 @@ def create_home_run_evolution(hitting_df):
     hr_data = hr_data.sort_values('year')
     
     # Add era context
-    hr_data['era_info'] = hr_data['year'].apply(lambda x: get_era_context(x)['era'])
-    hr_data['context'] = hr_data['year'].apply(lambda x: get_era_context(x)['context'])
+    for column, field in [('era_info', 'era'), ('context', 'context')]:
+        lookup = {year: info[field] for year, info in ERA_CONTEXT.items()}
+        hr_data[column] = hr_data['year'].map(lookup).fillna(UNKNOWN_ERA[field])
     
     fig = go.Figure()
     
@@ -128,24 +139,24 @@ def create_home_run_evolution(hitting_df):
         "Modern Rules": "#17becf"
     }
     
-    for _, row in hr_data.iterrows():
+    for row in hr_data.itertuples(index=False):
         fig.add_trace(go.Scatter(
-            x=[row['year']],
-            y=[row['stat_value']],
+            x=[row.year],
+            y=[row.stat_value],
             mode='markers+text',
-            name=row['era_info'],
+            name=row.era_info,
             marker=dict(
                 size=20,
-                color=era_colors.get(row['era_info'], '#999999'),
+                color=era_colors.get(row.era_info, '#999999'),
                 line=dict(width=2, color='white')
             ),
-            text=f"{row['player_name']}<br>{int(row['stat_value'])} HRs",
+            text=f"{row.player_name}<br>{int(row.stat_value)} HRs",
             textposition="top center",
-            hovertemplate=f"<b>{row['player_name']}</b><br>" +
-                         f"Year: {row['year']}<br>" +
-                         f"Home Runs: {int(row['stat_value'])}<br>" +
-                         f"Era: {row['era_info']}<br>" +
-                         f"Context: {row['context']}<extra></extra>",
+            hovertemplate=f"<b>{row.player_name}</b><br>" +
+                         f"Year: {row.year}<br>" +
+                         f"Home Runs: {int(row.stat_value)}<br>" +
+                         f"Era: {row.era_info}<br>" +
+                         f"Context: {row.context}<extra></extra>",
             showlegend=False
         ))
     
@@ -170,22 +181,37 @@ def create_home_run_evolution(hitting_df):
     
     return fig
 
+# Full team name -> city/nickname variations a leader's team may be listed as
+TEAM_VARIATIONS = {
+    'new york yankees': ['new york', 'yankees'],
+    'boston red sox': ['boston', 'red sox'],
+    'detroit tigers': ['detroit', 'tigers'],
+    'chicago white sox': ['chicago', 'white sox'],
+    'cleveland indians': ['cleveland', 'indians'],
+    'cleveland guardians': ['cleveland', 'guardians'],
+    'baltimore orioles': ['baltimore', 'orioles'],
+    'minnesota twins': ['minnesota', 'twins'],
+    'oakland athletics': ['oakland', 'athletics'],
+    'kansas city royals': ['kansas city', 'royals'],
+    'seattle mariners': ['seattle', 'mariners'],
+    'texas rangers': ['texas', 'rangers'],
+    'houston astros': ['houston', 'astros'],
+    'los angeles angels': ['los angeles', 'anaheim', 'california', 'angels'],
+    'toronto blue jays': ['toronto', 'blue jays'],
+    'tampa bay rays': ['tampa bay', 'rays']
+}
+
 def create_team_dominance_analysis(standings_df, hitting_df, pitching_df):
     """Analyze what factors contribute to team dominance"""
     
     # Get top teams (>100 wins or top win% for each year)
-    dominant_teams = []
-    for year in standings_df['year'].unique():
-        year_data = standings_df[standings_df['year'] == year]
-        top_team = year_data.loc[year_data['wins'].idxmax()]
-        dominant_teams.append(top_team)
-    
-    dominant_df = pd.DataFrame(dominant_teams)
+    dominant_df = standings_df.loc[standings_df.groupby('year', sort=False)['wins'].idxmax()]
     
     # Better team matching function
     def match_team_names(full_team_name, player_team_name):
         """Better team name matching between full names and city names"""
-        if pd.isna(player_team_name):
+        # Plain scalar checks: pd.isna dispatches through pandas on every pair
+        if player_team_name is None or (isinstance(player_team_name, float) and math.isnan(player_team_name)):
             return False
         
         full_name_lower = str(full_team_name).lower()
@@ -196,62 +222,40 @@ def create_team_dominance_analysis(standings_df, hitting_df, pitching_df):
             return True
         
         # Handle common variations
-        team_mappings = {
-            'new york yankees': ['new york', 'yankees'],
-            'boston red sox': ['boston', 'red sox'],
-            'detroit tigers': ['detroit', 'tigers'],
-            'chicago white sox': ['chicago', 'white sox'],
-            'cleveland indians': ['cleveland', 'indians'],
-            'cleveland guardians': ['cleveland', 'guardians'],
-            'baltimore orioles': ['baltimore', 'orioles'],
-            'minnesota twins': ['minnesota', 'twins'],
-            'oakland athletics': ['oakland', 'athletics'],
-            'kansas city royals': ['kansas city', 'royals'],
-            'seattle mariners': ['seattle', 'mariners'],
-            'texas rangers': ['texas', 'rangers'],
-            'houston astros': ['houston', 'astros'],
-            'los angeles angels': ['los angeles', 'anaheim', 'california', 'angels'],
-            'toronto blue jays': ['toronto', 'blue jays'],
-            'tampa bay rays': ['tampa bay', 'rays']
-        }
-        
-        for full_name, variations in team_mappings.items():
+        for full_name, variations in TEAM_VARIATIONS.items():
             if full_name in full_name_lower:
                 return any(var in player_team_lower for var in variations)
         
         return False
     
-    # Try to match with offensive/pitching performance
-    analysis_data = []
-    for _, team in dominant_df.iterrows():
-        year = team['year']
-        team_name = team['team_name']
-        
-        # Count statistical leaders from this team
-        year_hitting = hitting_df[hitting_df['year'] == year]
-        year_pitching = pitching_df[pitching_df['year'] == year]
+    def count_team_leaders(leaders_df):
+        """Count statistical leaders from each year's dominant team"""
+        # Pair every leader with the dominant team of the same year in one merge
+        # instead of re-filtering the leaders frame per team
+        paired = leaders_df[['year', 'team']].merge(dominant_df[['year', 'team_name']], on='year')
         
-        # Better matching using the function above
-        hitting_leaders = len(year_hitting[
-            year_hitting['team'].apply(lambda x: match_team_names(team_name, x))
-        ])
-        
-        pitching_leaders = len(year_pitching[
-            year_pitching['team'].apply(lambda x: match_team_names(team_name, x))
-        ])
-        
-        analysis_data.append({
-            'year': year,
-            'team': team_name,
-            'wins': team['wins'],
-            'win_pct': team['win_pct'],
-            'hitting_leaders': hitting_leaders,
-            'pitching_leaders': pitching_leaders,
-            'total_leaders': hitting_leaders + pitching_leaders,
-            'era': get_era_context(year)['era']
-        })
-    
-    analysis_df = pd.DataFrame(analysis_data)
+        # Better matching using the function above, evaluated once per
+        # distinct (dominant team, leader team) pair and joined back
+        pairs = paired[['team_name', 'team']].drop_duplicates()
+        pairs['matched'] = [match_team_names(team_name, team) for team_name, team in zip(pairs['team_name'], pairs['team'])]
+        paired = paired.merge(pairs, on=['team_name', 'team'], how='left')
+        counts = paired[paired['matched'].to_numpy(dtype=bool)].groupby('year').size()
+        return counts.reindex(dominant_df['year'], fill_value=0).to_numpy()
+    
+    # Try to match with offensive/pitching performance
+    hitting_leaders = count_team_leaders(hitting_df)
+    pitching_leaders = count_team_leaders(pitching_df)
+    
+    analysis_df = pd.DataFrame({
+        'year': dominant_df['year'].to_numpy(),
+        'team': dominant_df['team_name'].to_numpy(),
+        'wins': dominant_df['wins'].to_numpy(),
+        'win_pct': dominant_df['win_pct'].to_numpy(),
+        'hitting_leaders': hitting_leaders,
+        'pitching_leaders': pitching_leaders,
+        'total_leaders': hitting_leaders + pitching_leaders,
+        'era': [get_era_context(year)['era'] for year in dominant_df['year']]
+    })
     
     # Create visualization
     fig = go.Figure()
@@ -405,9 +409,10 @@ def create_historical_events_timeline(events_df):
     # Add annotations for key eras
     annotations = []
     era_years = [1927, 1947, 1961, 1969, 1994, 1998, 2001, 2016, 2020, 2023]
+    year_totals = events_df['year'].value_counts()
     for year in era_years:
         era_info = get_era_context(year)
-        year_total = event_counts[event_counts['year'] == year]['count'].sum()
+        year_total = year_totals.get(year, 0)
         if year_total > 0:
             annotations.append(
                 dict(
@@ -627,8 +632,8 @@ def main():
                 
                 st.write(f"**Average Statistical Leaders per Dominant Team:** {avg_leaders:.1f}")
                 st.write("**Most Dominant Teams:**")
-                for _, team in top_teams.iterrows():
-                    st.write(f"• {team['team']} ({team['year']}): {team['wins']} wins, {team['total_leaders']} category leaders")
+                for team in top_teams.itertuples(index=False):
+                    st.write(f"• {team.team} ({team.year}): {team.wins} wins, {team.total_leaders} category leaders")
             
             with col2:
                 st.markdown("### 📊 Success Correlation")
@@ -678,9 +683,9 @@ def main():
                         # Show detailed events in a more readable format
                         st.write("**Sample Events:**")
                         sample_events = year_events.sample(min(3, len(year_events)))
-                        for _, event in sample_events.iterrows():
+                        for event in sample_events.itertuples(index=False):
                             # Create a cleaner display of events
-                            event_text = event['description']
+                            event_text = event.description
                             
                             # Truncate very long descriptions but keep them meaningful
                             if len(event_text) > 200:
@@ -693,17 +698,17 @@ def main():
                             
                             # Display with better formatting
                             st.markdown(f"""
-                            **{event['event_type']}**: {event_text}
+                            **{event.event_type}**: {event_text}
                             """)
                             
                         # Add option to see all events
                         if len(year_events) > 3:
                             if st.button(f"Show all {len(year_events)} events for {year}", key=f"show_all_{year}"):
                                 st.write("**All Events:**")
-                                for _, event in year_events.iterrows():
-                                    with st.expander(f"{event['event_type']}: {event['description'][:80]}..."):
-                                        st.write(f"**Category:** {event['event_type']}")
-                                        st.write(f"**Full Description:** {event['description']}")
+                                for event in year_events.itertuples(index=False):
+                                    with st.expander(f"{event.event_type}: {event.description[:80]}..."):
+                                        st.write(f"**Category:** {event.event_type}")
+                                        st.write(f"**Full Description:** {event.description}")
         else:
             st.info("No events data available for selected eras")
     
@@ -804,11 +809,11 @@ def main():
                 display_events = display_events.sort_values('year', ascending=False)
                 
                 # Show events in a more readable format
-                for _, event in display_events.iterrows():
-                    with st.expander(f"{event['year']} - {event['event_type']}: {event['description'][:60]}..."):
-                        st.write(f"**Year:** {event['year']}")
-                        st.write(f"**Category:** {event['event_type']}")
-                        st.write(f"**Description:** {event['description']}")
+                for event in display_events.itertuples(index=False):
+                    with st.expander(f"{event.year} - {event.event_type}: {event.description[:60]}..."):
+                        st.write(f"**Year:** {event.year}")
+                        st.write(f"**Category:** {event.event_type}")
+                        st.write(f"**Description:** {event.description}")
             else:
                 st.info("No events data available")
     
@@ -1,209 +1,259 @@
 import pandas as pd
 import numpy as np
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-def clean_mlb_data():
-    """Simple but effective data cleaning for MLB data"""
+# Team name mapping from city to full team name
+TEAM_MAPPING = {
+    'New York': 'New York Yankees',
+    'Boston': 'Boston Red Sox',
+    'Detroit': 'Detroit Tigers', 
+    'Chicago': 'Chicago White Sox',  # Default to AL team
+    'Philadelphia': 'Philadelphia Athletics',
+    'Washington': 'Washington Senators',
+    'St. Louis': 'St. Louis Cardinals',
+    'Cleveland': 'Cleveland Indians',
+    'Baltimore': 'Baltimore Orioles',
+    'Minnesota': 'Minnesota Twins',
+    'Oakland': 'Oakland Athletics',
+    'Kansas City': 'Kansas City Royals',
+    'Milwaukee': 'Milwaukee Brewers',
+    'Toronto': 'Toronto Blue Jays',
+    'Seattle': 'Seattle Mariners',
+    'Tampa Bay': 'Tampa Bay Rays',
+    'Los Angeles': 'Los Angeles Angels',
+    'Anaheim': 'Los Angeles Angels',
+    'California': 'Los Angeles Angels',
+    'Texas': 'Texas Rangers',
+    'Houston': 'Houston Astros'
+}
+
+# Cities whose franchise changed over time: season boundaries and the
+# team name for each resulting bin (a year equal to a boundary falls in
+# the earlier bin)
+YEAR_DEPENDENT_TEAMS = {
+    'St. Louis': (np.array([1953]), np.array(['St. Louis Browns', 'St. Louis Cardinals'])),
+    'Washington': (np.array([1971]), np.array(['Washington Senators', 'Washington Nationals']))
+}
+
+# Validate ranges by category (updated with more relevant stats)
+STAT_RANGES = {
+    'Home Runs': (0, 100),
+    'Batting Average': (0.200, 0.500),  # More realistic minimum
+    'RBI': (50, 200),  # Leaders typically 50+
+    'Runs': (50, 200),
+    'Hits': (100, 300),
+    'Doubles': (20, 70),
+    'Triples': (5, 30),
+    'On Base Percentage': (0.300, 0.600),
+    'Slugging Average': (0.400, 0.900),
+    'Base on Balls': (50, 200),
+    'Total Bases': (200, 500),
+    # Pitching stats
+    'ERA': (1.00, 6.00),  # Leaders typically under 6
+    'Wins': (10, 35),
+    'Strikeouts': (100, 400),
+    'Saves': (20, 70),  # Modern save totals
+    'Complete Games': (5, 40),
+    'Shutouts': (2, 15),
+    'Winning Percentage': (0.500, 1.000)  # Leaders above .500
+}
+
+# Per-category bounds as arrays indexed by category position, so each frame
+# is checked with one gather. Unknown categories get code -1, which picks
+# the trailing [0, inf] range: they are only checked for being positive
+STAT_CATEGORIES = pd.Index(list(STAT_RANGES))
+STAT_MINS = np.array([low for low, _ in STAT_RANGES.values()] + [0.0])
+STAT_MAXS = np.array([high for _, high in STAT_RANGES.values()] + [np.inf])
+
+def clean_text(series, fill=''):
+    """Whole-column string cleanup: fill missing values, cast to str and strip"""
+    return series.fillna(fill).astype(str).str.strip()
+
+def coerce_numeric(df, columns):
+    """Parse numeric columns in one vectorized pass; unparseable values become NaN"""
+    return df.assign(**{column: pd.to_numeric(df[column], errors='coerce') for column in columns})
+
+def text_lengths(series):
+    """String lengths of a cleaned text column as a plain NumPy array"""
+    return series.str.len().to_numpy()
+
+def standardize_team_names(df):
+    """Standardize team names based on city and year (expects a cleaned team column)"""
+    teams = df['team']
+    
+    # Chicago defaults to the White Sox (AL context) and the Angels'
+    # former cities are all covered by the static mapping
+    standardized = teams.map(TEAM_MAPPING).fillna(teams)
+    
+    # Handle special cases based on year
+    years = df['year'].to_numpy()
+    for city, (boundaries, names) in YEAR_DEPENDENT_TEAMS.items():
+        is_city = (teams == city).to_numpy()
+        if is_city.any():
+            bins = np.searchsorted(boundaries, years[is_city], side='left')
+            standardized.loc[is_city] = names[bins]
+    
+    return standardized
+
+def is_valid_stat(df):
+    """Boolean mask of rows whose stat_value falls inside its category range"""
+    values = df['stat_value'].to_numpy(dtype=float)
+    codes = STAT_CATEGORIES.get_indexer(df['stat_category'])
+    
+    # Combine the bounds in place rather than through np.where over a
+    # separate known-category mask
+    valid = values >= STAT_MINS[codes]
+    valid &= values <= STAT_MAXS[codes]
+    return valid
+
+# Improve event classification with more specific categories
+# Event type -> description keywords, most specific first; the first
+# matching rule wins, anything unmatched is a historical note
+EVENT_RULES = [
+    ('Championships', ['world series', 'championship', 'swept']),
+    ('Pitching Feats', ['no-hitter', 'no-hit', 'perfect game']),
+    ('Records Broken', ['record', 'first player', 'first time', 'broke', 'set a new', 'milestone']),
+    ('Player Debuts', ['debut', 'first game', 'rookie', 'first african-american', 'first black']),
+    ('Career Endings', ['retire', 'retirement', 'final game', 'last season']),
+    ('Deaths', ['death', 'died', 'passed away']),
+    ('Awards & Honors', ['mvp', 'cy young', 'hall of fame', 'award', 'honor']),
+    ('Trades & Signings', ['trade', 'traded', 'signed', 'contract', 'acquired']),
+    ('Labor Issues', ['strike', 'lockout', 'union', 'players association', 'salary']),
+    ('Rule Changes', ['rule', 'designated hitter', 'mound', 'expansion', 'playoff']),
+    ('Stadium Events', ['stadium', 'ballpark', 'field', 'opening day']),
+    ('Injuries', ['injury', 'injured', 'hospital', 'surgery']),
+    ('Ceremonies', ['celebration', 'ceremony', 'day', 'honor', 'tribute']),
+    ('Season Events', ['season', 'games', 'schedule', 'postponed', 'cancelled']),
+    # More specific fallback based on content
+    ('Home Run Events', ['home run', 'homer']),
+    ('Team Milestones', ['yankees', 'red sox', 'cubs', 'dodgers']),
+    ('Game Highlights', ['game', 'inning', 'hit', 'run', 'win'])
+]
+EVENT_TYPES = [event_type for event_type, _ in EVENT_RULES]
+EVENT_PATTERNS = ['|'.join(re.escape(term) for term in terms) for _, terms in EVENT_RULES]
+
+def reclassify_events(descriptions):
+    """Classify a whole column of event descriptions with one np.select"""
+    desc_lower = descriptions.str.lower()
+    conditions = [desc_lower.str.contains(pattern, regex=True).to_numpy(dtype=bool) for pattern in EVENT_PATTERNS]
+    return np.select(conditions, EVENT_TYPES, default='Historical Notes')
+
+def clean_leaders(leaders_df, label, min_name_length=0):
+    """Clean hitting or pitching leaders"""
+    print(f"Cleaning {label} data...")
+    leaders_df = coerce_numeric(leaders_df, ['stat_value'])
+    
+    # Missing names/values, obviously bad data and too-short names are
+    # dropped in one pass (is_valid_stat already rejects missing stat values)
+    player_names = clean_text(leaders_df['player_name'])
+    keep = (leaders_df['player_name'].notna().to_numpy()
+            & is_valid_stat(leaders_df)
+            & (text_lengths(player_names) >= min_name_length))
+    leaders_df = leaders_df[keep].copy()
+    leaders_df['player_name'] = player_names[keep]
+    leaders_df['team'] = clean_text(leaders_df['team'], fill='Unknown')
+    
+    # Standardize team names
+    leaders_df['team'] = standardize_team_names(leaders_df).astype('category')
+    return leaders_df
+
+def clean_standings(standings_df):
+    """Clean team standings and recalculate win percentage"""
+    print("Cleaning standings data...")
+    standings_df = coerce_numeric(standings_df, ['wins', 'losses'])
+    wins = standings_df['wins'].to_numpy(dtype=float)
+    losses = standings_df['losses'].to_numpy(dtype=float)
+    
+    # One combined mask over plain arrays (NaN fails every comparison), one slice
+    keep = (wins >= 30) & (wins <= 130)
+    keep &= (losses >= 30) & (losses <= 130)
+    keep &= standings_df['team_name'].notna().to_numpy()
+    standings_df = standings_df[keep].copy()
+    
+    # coerce_numeric leaves wins/losses as float64 when a value was missing;
+    # the surviving rows are validated counts, so write them back as integers
+    standings_df = standings_df.astype({'wins': int, 'losses': int})
+    
+    # Recalculate win percentage
+    standings_df['win_pct'] = standings_df['wins'] / (standings_df['wins'] + standings_df['losses'])
+    standings_df['win_pct'] = standings_df['win_pct'].round(3)
+    return standings_df
+
+def clean_events(events_df):
+    """Clean notable events and reclassify them by description"""
+    print("Cleaning events data...")
+    descriptions = clean_text(events_df['description'])
+    
+    # Remove missing and very short descriptions in one slice (missing ones
+    # are cleaned to '' and fail the length check)
+    keep = text_lengths(descriptions) >= 30
+    events_df = events_df[keep].assign(description=descriptions[keep])
+    
+    events_df['event_type'] = reclassify_events(events_df['description'])
+    return events_df
+
+# Raw input name -> read_csv options. stat_category is low-cardinality, so
+# it is parsed straight into a categorical and the range lookup maps each
+# distinct category once instead of once per row; the raw event_type is
+# recomputed by the cleaner, so it is never read
+LEADER_READ_OPTIONS = {'dtype': {'stat_category': 'category'}}
+RAW_READ_OPTIONS = {
+    'yearly_hitting_leaders': LEADER_READ_OPTIONS,
+    'yearly_pitching_leaders': LEADER_READ_OPTIONS,
+    'team_standings': {},
+    'notable_events': {'usecols': ['year', 'description']}
+}
+
+# Raw input name -> cleaner; each dataset is cleaned independently
+CLEANERS = {
+    'yearly_hitting_leaders': partial(clean_leaders, label='hitting'),
+    'yearly_pitching_leaders': partial(clean_leaders, label='pitching', min_name_length=3),
+    'team_standings': clean_standings,
+    'notable_events': clean_events
+}
+
+def clean_mlb_data(max_workers=len(CLEANERS)):
+    """Simple but effective data cleaning for MLB data
+    
+    The datasets share no state, so they are cleaned in worker threads
+    (the cleaners are whole-column pandas/NumPy work, which is cheaper to
+    overlap in threads than to ship to worker processes); pass
+    max_workers=1 to clean them sequentially.
+    """
     
     print("Starting simple data cleaning...")
     
     # Load data
     try:
-        hitting_df = pd.read_csv('data/raw/yearly_hitting_leaders.csv')
-        pitching_df = pd.read_csv('data/raw/yearly_pitching_leaders.csv')
-        standings_df = pd.read_csv('data/raw/team_standings.csv')
-        events_df = pd.read_csv('data/raw/notable_events.csv')
+        raw = {name: pd.read_csv(f'data/raw/{name}.csv', **RAW_READ_OPTIONS[name]) for name in CLEANERS}
     except FileNotFoundError as e:
         print(f"Error loading data: {e}")
         return
     
-    print(f"Loaded: {len(hitting_df)} hitting, {len(pitching_df)} pitching, "
-          f"{len(standings_df)} standings, {len(events_df)} events")
-    
-    # Team name mapping from city to full team name
-    team_mapping = {
-        'New York': 'New York Yankees',
-        'Boston': 'Boston Red Sox',
-        'Detroit': 'Detroit Tigers', 
-        'Chicago': 'Chicago White Sox',  # Default to AL team
-        'Philadelphia': 'Philadelphia Athletics',
-        'Washington': 'Washington Senators',
-        'St. Louis': 'St. Louis Cardinals',
-        'Cleveland': 'Cleveland Indians',
-        'Baltimore': 'Baltimore Orioles',
-        'Minnesota': 'Minnesota Twins',
-        'Oakland': 'Oakland Athletics',
-        'Kansas City': 'Kansas City Royals',
-        'Milwaukee': 'Milwaukee Brewers',
-        'Toronto': 'Toronto Blue Jays',
-        'Seattle': 'Seattle Mariners',
-        'Tampa Bay': 'Tampa Bay Rays',
-        'Los Angeles': 'Los Angeles Angels',
-        'Anaheim': 'Los Angeles Angels',
-        'California': 'Los Angeles Angels',
-        'Texas': 'Texas Rangers',
-        'Houston': 'Houston Astros'
-    }
-    
-    def standardize_team_name(team, year):
-        """Standardize team names based on city and year"""
-        if pd.isna(team):
-            return 'Unknown'
-        
-        team = str(team).strip()
-        
-        # Handle special cases based on year
-        if team == 'Chicago':
-            # Could be Cubs or White Sox - assume White Sox for AL context
-            return 'Chicago White Sox'
-        elif team == 'St. Louis':
-            if year <= 1953:
-                return 'St. Louis Browns'
-            else:
-                return 'St. Louis Cardinals'
-        elif team == 'Washington':
-            if year <= 1971:
-                return 'Washington Senators'
-            else:
-                return 'Washington Nationals'
-        elif team in ['Los Angeles', 'California', 'Anaheim']:
-            return 'Los Angeles Angels'
-        
-        # Use mapping for other teams
-        return team_mapping.get(team, team)
-    
-    # Clean hitting data
-    print("Cleaning hitting data...")
-    hitting_df = hitting_df.dropna(subset=['player_name', 'stat_value'])
-    hitting_df['player_name'] = hitting_df['player_name'].str.strip()
-    hitting_df['team'] = hitting_df['team'].fillna('Unknown')
-    
-    # Standardize team names in hitting data
-    hitting_df['team'] = hitting_df.apply(lambda row: standardize_team_name(row['team'], row['year']), axis=1)
-    
-    # Validate ranges by category (updated with more relevant stats)
-    stat_ranges = {
-        'Home Runs': (0, 100),
-        'Batting Average': (0.200, 0.500),  # More realistic minimum
-        'RBI': (50, 200),  # Leaders typically 50+
-        'Runs': (50, 200),
-        'Hits': (100, 300),
-        'Doubles': (20, 70),
-        'Triples': (5, 30),
-        'On Base Percentage': (0.300, 0.600),
-        'Slugging Average': (0.400, 0.900),
-        'Base on Balls': (50, 200),
-        'Total Bases': (200, 500),
-        # Pitching stats
-        'ERA': (1.00, 6.00),  # Leaders typically under 6
-        'Wins': (10, 35),
-        'Strikeouts': (100, 400),
-        'Saves': (20, 70),  # Modern save totals
-        'Complete Games': (5, 40),
-        'Shutouts': (2, 15),
-        'Winning Percentage': (0.500, 1.000)  # Leaders above .500
-    }
-    
-    # Remove obviously bad data with improved validation
-    def is_valid_stat(row):
-        category = row.get('stat_category', '')
-        value = row.get('stat_value', 0)
-        
-        if category in stat_ranges:
-            min_val, max_val = stat_ranges[category]
-            return min_val <= value <= max_val
-        
-        # For unknown categories, just check if positive
-        return value >= 0
-    
-    hitting_df = hitting_df[hitting_df.apply(is_valid_stat, axis=1)]
-    pitching_df = pitching_df[pitching_df.apply(is_valid_stat, axis=1)]
-    
-    # Clean pitching data
-    print("Cleaning pitching data...")
-    pitching_df = pitching_df.dropna(subset=['player_name', 'stat_value'])
-    pitching_df['player_name'] = pitching_df['player_name'].str.strip()
-    pitching_df['team'] = pitching_df['team'].fillna('Unknown')
-    
-    # Standardize team names in pitching data
-    pitching_df['team'] = pitching_df.apply(lambda row: standardize_team_name(row['team'], row['year']), axis=1)
-    
-    # Remove obviously bad data with improved validation
-    pitching_df = pitching_df[pitching_df.apply(is_valid_stat, axis=1)]
-    pitching_df = pitching_df[pitching_df['player_name'].str.len() > 2]
-    
-    # Clean standings data
-    print("Cleaning standings data...")
-    standings_df = standings_df.dropna(subset=['team_name', 'wins', 'losses'])
-    standings_df = standings_df[(standings_df['wins'] >= 30) & (standings_df['wins'] <= 130)]
-    standings_df = standings_df[(standings_df['losses'] >= 30) & (standings_df['losses'] <= 130)]
+    print(f"Loaded: {len(raw['yearly_hitting_leaders'])} hitting, {len(raw['yearly_pitching_leaders'])} pitching, "
+          f"{len(raw['team_standings'])} standings, {len(raw['notable_events'])} events")
     
-    # Recalculate win percentage
-    standings_df['win_pct'] = standings_df['wins'] / (standings_df['wins'] + standings_df['losses'])
-    standings_df['win_pct'] = standings_df['win_pct'].round(3)
+    if max_workers == 1:
+        cleaned_outputs = {name: cleaner(raw[name]) for name, cleaner in CLEANERS.items()}
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(cleaner, raw[name]) for name, cleaner in CLEANERS.items()}
+            cleaned_outputs = {name: future.result() for name, future in futures.items()}
     
-    # Clean events data
-    print("Cleaning events data...")
-    events_df = events_df.dropna(subset=['description'])
-    events_df['description'] = events_df['description'].str.strip()
-    
-    # Remove very short descriptions
-    events_df = events_df[events_df['description'].str.len() >= 30]
-    
-    # Improve event classification with more specific categories
-    def reclassify_event(description):
-        desc_lower = description.lower()
-        
-        # Most specific first
-        if any(term in desc_lower for term in ['world series', 'championship', 'swept']):
-            return 'Championships'
-        elif any(term in desc_lower for term in ['no-hitter', 'no-hit', 'perfect game']):
-            return 'Pitching Feats'
-        elif any(term in desc_lower for term in ['record', 'first player', 'first time', 'broke', 'set a new', 'milestone']):
-            return 'Records Broken'
-        elif any(term in desc_lower for term in ['debut', 'first game', 'rookie', 'first african-american', 'first black']):
-            return 'Player Debuts'
-        elif any(term in desc_lower for term in ['retire', 'retirement', 'final game', 'last season']):
-            return 'Career Endings'
-        elif any(term in desc_lower for term in ['death', 'died', 'passed away']):
-            return 'Deaths'
-        elif any(term in desc_lower for term in ['mvp', 'cy young', 'hall of fame', 'award', 'honor']):
-            return 'Awards & Honors'
-        elif any(term in desc_lower for term in ['trade', 'traded', 'signed', 'contract', 'acquired']):
-            return 'Trades & Signings'
-        elif any(term in desc_lower for term in ['strike', 'lockout', 'union', 'players association', 'salary']):
-            return 'Labor Issues'
-        elif any(term in desc_lower for term in ['rule', 'designated hitter', 'mound', 'expansion', 'playoff']):
-            return 'Rule Changes'
-        elif any(term in desc_lower for term in ['stadium', 'ballpark', 'field', 'opening day']):
-            return 'Stadium Events'
-        elif any(term in desc_lower for term in ['injury', 'injured', 'hospital', 'surgery']):
-            return 'Injuries'
-        elif any(term in desc_lower for term in ['celebration', 'ceremony', 'day', 'honor', 'tribute']):
-            return 'Ceremonies'
-        elif any(term in desc_lower for term in ['season', 'games', 'schedule', 'postponed', 'cancelled']):
-            return 'Season Events'
-        else:
-            # More specific fallback based on content
-            if 'home run' in desc_lower or 'homer' in desc_lower:
-                return 'Home Run Events'
-            elif any(team in desc_lower for team in ['yankees', 'red sox', 'cubs', 'dodgers']):
-                return 'Team Milestones'
-            elif any(term in desc_lower for term in ['game', 'inning', 'hit', 'run', 'win']):
-                return 'Game Highlights'
-            else:
-                return 'Historical Notes'
-    
-    events_df['event_type'] = events_df['description'].apply(reclassify_event)
+    hitting_df = cleaned_outputs['yearly_hitting_leaders']
+    pitching_df = cleaned_outputs['yearly_pitching_leaders']
+    standings_df = cleaned_outputs['team_standings']
+    events_df = cleaned_outputs['notable_events']
     
     # Create output directory
     os.makedirs('data/cleaned', exist_ok=True)
     
-    # Save cleaned data
-    hitting_df.to_csv('data/cleaned/yearly_hitting_leaders_cleaned.csv', index=False)
-    pitching_df.to_csv('data/cleaned/yearly_pitching_leaders_cleaned.csv', index=False)
-    standings_df.to_csv('data/cleaned/team_standings_cleaned.csv', index=False)
-    events_df.to_csv('data/cleaned/notable_events_cleaned.csv', index=False)
+    # Save cleaned data (file names are what db_import.py and the dashboard read)
+    for name, df in cleaned_outputs.items():
+        df.to_csv(f'data/cleaned/{name}_cleaned.csv', index=False)
     
     print(f"\nCleaned data saved!")
     print(f"Final counts: {len(hitting_df)} hitting, {len(pitching_df)} pitching, "
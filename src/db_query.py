@@ -2,12 +2,23 @@ import sqlite3
 import pandas as pd
 import os
 import sys
-from typing import List, Dict, Any
+from pathlib import Path
+from typing import List, Dict, Any, Optional
 
 class MLBQueryProgram:
     def __init__(self, db_path: str = 'data/mlb_database.db'):
         self.db_path = db_path
         self.conn = None
+        self.cursor = None
+        
+        # Output formatting for display_results, set once per program
+        pd.set_option('display.max_columns', None)
+        pd.set_option('display.width', None)
+        pd.set_option('display.max_colwidth', 50)
+        
+        # Preview results of predefined queries, keyed by SQL text. The
+        # connection is query-only, so results stay valid until reconnecting
+        self.query_cache = {}
         self.predefined_queries = {
             '1': {
                 'name': 'Top Home Run Leaders by Year',
@@ -22,12 +33,14 @@ class MLBQueryProgram:
                 'name': 'ERA Leaders and Team Performance',
                 'query': '''
                     SELECT p.year, p.player_name, p.team, p.stat_value as era,
-                           ROUND(AVG(s.win_pct), 3) as avg_league_win_pct,
-                           COUNT(s.team_name) as teams_that_year
+                           s.avg_league_win_pct, s.teams_that_year
                     FROM pitching_leaders p
-                    JOIN standings s ON p.year = s.year 
+                    JOIN (SELECT year,
+                                 ROUND(AVG(win_pct), 3) as avg_league_win_pct,
+                                 COUNT(team_name) as teams_that_year
+                          FROM standings
+                          GROUP BY year) s ON p.year = s.year
                     WHERE p.stat_category = 'ERA'
-                    GROUP BY p.year, p.player_name, p.team, p.stat_value
                     ORDER BY p.year, p.stat_value ASC;
                 '''
             },
@@ -46,14 +59,20 @@ class MLBQueryProgram:
             '4': {
                 'name': 'Yankees Performance Across Years',
                 'query': '''
+                    WITH h AS (SELECT year, COUNT(*) as c FROM hitting_leaders
+                               WHERE team LIKE '%New York%' GROUP BY year),
+                         p AS (SELECT year, COUNT(*) as c FROM pitching_leaders
+                               WHERE team LIKE '%New York%' GROUP BY year),
+                         e AS (SELECT year, COUNT(*) as c FROM notable_events
+                               WHERE description LIKE '%Yankees%' GROUP BY year)
                     SELECT s.year, s.wins, s.losses, s.win_pct,
-                           (SELECT COUNT(*) FROM hitting_leaders h 
-                            WHERE h.year = s.year AND h.team LIKE '%New York%') as hitting_leaders,
-                           (SELECT COUNT(*) FROM pitching_leaders p 
-                            WHERE p.year = s.year AND p.team LIKE '%New York%') as pitching_leaders,
-                           (SELECT COUNT(*) FROM notable_events e 
-                            WHERE e.year = s.year AND e.description LIKE '%Yankees%') as yankees_events
+                           COALESCE(h.c, 0) as hitting_leaders,
+                           COALESCE(p.c, 0) as pitching_leaders,
+                           COALESCE(e.c, 0) as yankees_events
                     FROM standings s
+                    LEFT JOIN h ON h.year = s.year
+                    LEFT JOIN p ON p.year = s.year
+                    LEFT JOIN e ON e.year = s.year
                     WHERE s.team_name LIKE '%Yankees%'
                     ORDER BY s.year;
                 '''
@@ -148,7 +167,18 @@ class MLBQueryProgram:
             return False
         
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            # Read-only autocommit connection: the file is opened with
+            # mode=ro, there are no implicit transactions around statements,
+            # and writes are refused outright instead of being silently rolled
+            # back when the connection closes
+            db_uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            self.conn = sqlite3.connect(db_uri, uri=True, isolation_level=None)
+            # Sorts and GROUP BYs of the predefined queries use temp B-trees;
+            # keep them in memory instead of spilling to temp files
+            self.conn.execute("PRAGMA temp_store=MEMORY;")
+            # One cursor reused by every query for the life of the connection
+            self.cursor = self.conn.cursor()
+            self.query_cache.clear()
             print(f"Connected to database: {self.db_path}")
             return True
         except sqlite3.Error as e:
@@ -164,8 +194,14 @@ class MLBQueryProgram:
     def execute_query(self, query: str, params: tuple = ()) -> pd.DataFrame:
         """Execute a SQL query and return results as DataFrame"""
         try:
-            df = pd.read_sql_query(query, self.conn, params=params)
-            return df
+            # Build the frame straight from the cursor rows rather than going
+            # through read_sql_query's connection dispatch
+            cursor = self.cursor.execute(query, params)
+            if cursor.description is None:
+                return pd.DataFrame()
+            
+            columns = [column[0] for column in cursor.description]
+            return pd.DataFrame.from_records(cursor.fetchall(), columns=columns, coerce_float=True)
         except sqlite3.Error as e:
             print(f"SQL Error: {e}")
             return pd.DataFrame()
@@ -173,27 +209,48 @@ class MLBQueryProgram:
             print(f"Error executing query: {e}")
             return pd.DataFrame()
     
-    def display_results(self, df: pd.DataFrame, max_rows: int = 20):
+    def preview_query(self, query: str, params: tuple = (), max_rows: int = 20):
+        """Fetch only the rows that will be displayed, plus the total row count
+        
+        The remaining rows are counted off the cursor as they stream past
+        instead of being materialized into a DataFrame that is then cut down.
+        On an error the total row count is None, so callers can tell a failed
+        query apart from an empty result.
+        """
+        try:
+            cursor = self.cursor.execute(query, params)
+            if cursor.description is None:
+                return pd.DataFrame(), 0
+            
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchmany(max_rows)
+            total_rows = len(rows) + sum(1 for _ in cursor)
+            return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True), total_rows
+        except sqlite3.Error as e:
+            print(f"SQL Error: {e}")
+            return pd.DataFrame(), None
+        except Exception as e:
+            print(f"Error executing query: {e}")
+            return pd.DataFrame(), None
+    
+    def display_results(self, df: pd.DataFrame, max_rows: int = 20, total_rows: Optional[int] = None):
         """Display query results in a formatted way"""
         if df.empty:
             print("No results found.")
             return
         
-        print(f"\nQuery returned {len(df)} rows:")
+        if total_rows is None:
+            total_rows = len(df)
+        
+        print(f"\nQuery returned {total_rows} rows:")
         print("=" * 80)
         
         # Show first max_rows
         display_df = df.head(max_rows)
-        
-        # Format the output
-        pd.set_option('display.max_columns', None)
-        pd.set_option('display.width', None)
-        pd.set_option('display.max_colwidth', 50)
-        
         print(display_df.to_string(index=False))
         
-        if len(df) > max_rows:
-            print(f"\n... and {len(df) - max_rows} more rows")
+        if total_rows > max_rows:
+            print(f"\n... and {total_rows - max_rows} more rows")
         
         print("=" * 80)
     
@@ -219,8 +276,15 @@ class MLBQueryProgram:
             print(f"\nRunning: {query_info['name']}")
             print("-" * 40)
             
-            df = self.execute_query(query_info['query'])
-            self.display_results(df)
+            query = query_info['query']
+            if query in self.query_cache:
+                df, total_rows = self.query_cache[query]
+            else:
+                df, total_rows = self.preview_query(query)
+                # Failed queries are not cached, so a rerun shows the error again
+                if total_rows is not None:
+                    self.query_cache[query] = (df, total_rows)
+            self.display_results(df, total_rows=total_rows)
         else:
             print("Invalid query selection.")
     
@@ -251,8 +315,8 @@ class MLBQueryProgram:
         
         if query.strip():
             print(f"\nExecuting query...")
-            df = self.execute_query(query)
-            self.display_results(df)
+            df, total_rows = self.preview_query(query)
+            self.display_results(df, total_rows=total_rows)
     
     def show_schema(self):
         """Display database schema information"""
@@ -261,21 +325,23 @@ class MLBQueryProgram:
         print("="*60)
         
         # Get table information
-        tables_query = "SELECT name FROM sqlite_master WHERE type='table';"
+        # Skip SQLite's internal tables (e.g. sqlite_stat1 written by ANALYZE)
+        tables_query = "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';"
         tables_df = self.execute_query(tables_query)
         
         for table_name in tables_df['name']:
             print(f"\nTable: {table_name}")
             print("-" * 30)
             
-            # Get column information
-            pragma_query = f"PRAGMA table_info({table_name});"
-            columns_df = self.execute_query(pragma_query)
+            # Get column information. The table-valued pragma takes the table
+            # name as a bound parameter, so one statement text serves every table
+            pragma_query = 'SELECT name, type, "notnull", pk FROM pragma_table_info(?);'
+            columns_df = self.execute_query(pragma_query, (table_name,))
             
-            for _, row in columns_df.iterrows():
-                nullable = "NOT NULL" if row['notnull'] else "NULL"
-                pk = " (PRIMARY KEY)" if row['pk'] else ""
-                print(f"  {row['name']}: {row['type']} {nullable}{pk}")
+            for row in columns_df.itertuples(index=False):
+                nullable = "NOT NULL" if row.notnull else "NULL"
+                pk = " (PRIMARY KEY)" if row.pk else ""
+                print(f"  {row.name}: {row.type} {nullable}{pk}")
             
             # Get row count
             count_query = f"SELECT COUNT(*) as count FROM {table_name};"
@@ -293,10 +359,10 @@ class MLBQueryProgram:
             
             # Standings for that year
             standings_query = "SELECT team_name, wins, losses, win_pct FROM standings WHERE year = ? ORDER BY wins DESC;"
-            standings_df = self.execute_query(standings_query, (year,))
+            standings_df, standings_rows = self.preview_query(standings_query, (year,))
             if not standings_df.empty:
                 print(f"\nTeam Standings:")
-                self.display_results(standings_df)
+                self.display_results(standings_df, total_rows=standings_rows)
             
             # Top hitting stats by category
             hitting_query = """
@@ -305,10 +371,10 @@ class MLBQueryProgram:
                 WHERE year = ? 
                 ORDER BY stat_category, stat_value DESC;
             """
-            hitting_df = self.execute_query(hitting_query, (year,))
+            hitting_df, hitting_rows = self.preview_query(hitting_query, (year,))
             if not hitting_df.empty:
                 print(f"\nHitting Leaders:")
-                self.display_results(hitting_df)
+                self.display_results(hitting_df, total_rows=hitting_rows)
             
             # Top pitching stats
             pitching_query = """
@@ -317,17 +383,17 @@ class MLBQueryProgram:
                 WHERE year = ? 
                 ORDER BY stat_category, stat_value DESC;
             """
-            pitching_df = self.execute_query(pitching_query, (year,))
+            pitching_df, pitching_rows = self.preview_query(pitching_query, (year,))
             if not pitching_df.empty:
                 print(f"\nPitching Leaders:")
-                self.display_results(pitching_df)
+                self.display_results(pitching_df, total_rows=pitching_rows)
             
             # Notable events
             events_query = "SELECT event_type, SUBSTR(description, 1, 100) || '...' as summary FROM notable_events WHERE year = ?;"
-            events_df = self.execute_query(events_query, (year,))
+            events_df, events_rows = self.preview_query(events_query, (year,))
             if not events_df.empty:
                 print(f"\nNotable Events:")
-                self.display_results(events_df)
+                self.display_results(events_df, total_rows=events_rows)
                 
         except ValueError:
             print("Please enter a valid year (number).")
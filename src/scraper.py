@@ -1,21 +1,98 @@
 import os
+import csv
 import time
-import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
 import random
 import logging
+import re
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def compile_keywords(keywords):
+    """Compile a list of literal keywords into one alternation regex"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# Navigation and non-content text found on almanac pages
+SKIP_TEXT_RE = compile_keywords([
+    'baseball almanac',
+    'copyright',
+    'all rights reserved',
+    'find us on',
+    'follow @',
+    'stats awards',
+    'hosting 4 less',
+    'where what happened',
+    'player review',
+    'pitcher review',
+    'team standings',
+    'top 25',
+    'ballplayers autographs',
+    'left field1,500'
+])
+
+# Event text must mention at least one of these
+BASEBALL_INDICATOR_RE = compile_keywords([
+    'game', 'season', 'player', 'pitcher', 'hitter', 'baseball',
+    'home run', 'strikeout', 'hit', 'world series', 'record',
+    'debut', 'retire', 'no-hitter', 'yankees', 'red sox',
+    'league', 'major league', 'american league', 'national league'
+])
+
+# Non-baseball historical events mixed into the yearly pages
+NON_BASEBALL_RE = compile_keywords([
+    'earthquake', 'president', 'politics', 'war', 'murder',
+    'execution', 'european union', 'space shuttle', 'olympic'
+])
+
+# Priority-based event classification (most specific first)
+EVENT_CLASSIFICATIONS = [
+    (event_type, compile_keywords(keywords)) for event_type, keywords in [
+        ('World Series', ['world series', 'championship series', 'swept', 'game 7']),
+        ('No-Hitter', ['no-hitter', 'no-hit', 'perfect game', 'no hitter']),
+        ('Record', ['record', 'first player to', 'first time', 'most', 'fastest', 'longest', 'broke the record', 'set a new', 'all-time']),
+        ('Debut', ['debut', 'first game', 'first appearance', 'rookie', 'first african-american', 'first black player', 'expansion']),
+        ('Retirement', ['retire', 'retirement', 'final game', 'last season', 'announced retirement', 'career ended']),
+        ('Death', ['death', 'died', 'passed away']),
+        ('Award', ['mvp', 'most valuable player', 'cy young', 'rookie of the year', 'hall of fame', 'award']),
+        ('Transaction', ['trade', 'traded', 'acquired', 'signed', 'contract']),
+        ('Rule Change', ['rule', 'designated hitter', 'mound', 'strike zone', 'expansion', 'playoff format']),
+        ('Milestone', ['3000', '500', '400', 'milestone', 'career', 'thousandth'])
+    ]
+]
+
+# Table context keywords used to tell stat tables apart
+HITTING_TABLE_RE = compile_keywords(['player review', 'hitting', 'batting'])
+PITCHING_TABLE_RE = compile_keywords(['pitcher review', 'pitching'])
+STANDINGS_TABLE_RE = compile_keywords(['standings', 'team', 'wins', 'losses'])
+
+# Header and summary cells that show up in the player column
+NON_NAME_RE = compile_keywords(['statistic', 'name', 'team', 'league', 'total', 'average', 'leader'])
+
+# Reasonable ranges for scraped leader values
+PLAYER_STAT_RANGES = {
+    'Home Runs': (0, 100),
+    'Batting Average': (0.100, 0.500),
+    'RBI': (0, 200),
+    'ERA': (0.00, 10.00),
+    'Wins': (0, 35),
+    'Strikeouts': (0, 400),
+    'Saves': (0, 70)
+}
+
+# User agents rotated on every requests call
+REQUEST_USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+]
+
+# Field order of the record tuples collected for each dataset
+LEADER_COLUMNS = ('year', 'player_name', 'team', 'stat_category', 'stat_value')
+STANDINGS_COLUMNS = ('year', 'team_name', 'wins', 'losses', 'win_pct')
+EVENT_COLUMNS = ('year', 'description', 'event_type')
+
 class EnhancedMLBScraper:
     def __init__(self):
         self.hitting_data = []
@@ -58,6 +135,11 @@ class EnhancedMLBScraper:
             return
             
         try:
+            # Selenium is only needed as a fallback, so it is imported on
+            # first use instead of with the module
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            
             options = Options()
             options.add_argument("--headless")
             options.add_argument("--no-sandbox")
@@ -88,11 +170,7 @@ class EnhancedMLBScraper:
         """Try scraping with requests first (faster)"""
         try:
             # Rotate user agent
-            user_agents = [
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            ]
-            self.session.headers['User-Agent'] = random.choice(user_agents)
+            self.session.headers['User-Agent'] = random.choice(REQUEST_USER_AGENTS)
             
             response = self.session.get(url, timeout=timeout)
             response.raise_for_status()
@@ -108,14 +186,19 @@ class EnhancedMLBScraper:
     
     def scrape_with_selenium(self, url: str, timeout: int = 15) -> BeautifulSoup:
         """Fallback to Selenium for dynamic content"""
+        if not self.driver:
+            self.setup_driver()
+        
+        if not self.driver:
+            logger.error("WebDriver not available")
+            return None
+        
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        
         try:
-            if not self.driver:
-                self.setup_driver()
-            
-            if not self.driver:
-                logger.error("WebDriver not available")
-                return None
-            
             self.driver.get(url)
             
             # Wait for page to load
@@ -211,11 +294,7 @@ class EnhancedMLBScraper:
             event_type = self.classify_event_enhanced(cleaned_text)
             
             if cleaned_text and len(cleaned_text) > 50:  # Minimum length for meaningful events
-                self.events_data.append({
-                    'year': year,
-                    'description': cleaned_text,
-                    'event_type': event_type
-                })
+                self.events_data.append((year, cleaned_text, event_type))
                 processed_texts.add(cleaned_text)
                 events_found += 1
                 self.stats['data_points_collected'] += 1
@@ -230,47 +309,18 @@ class EnhancedMLBScraper:
         if text in processed_texts:
             return False
         
-        # Skip navigation and non-content
-        skip_patterns = [
-            r'baseball almanac',
-            r'copyright',
-            r'all rights reserved',
-            r'find us on',
-            r'follow @',
-            r'stats awards',
-            r'hosting 4 less',
-            r'where what happened',
-            r'player review',
-            r'pitcher review',
-            r'team standings',
-            r'top 25',
-            r'ballplayers autographs',
-            r'left field1,500'
-        ]
-        
         text_lower = text.lower()
-        for pattern in skip_patterns:
-            if pattern in text_lower:
-                return False
         
-        # Must contain baseball-related content
-        baseball_indicators = [
-            'game', 'season', 'player', 'pitcher', 'hitter', 'baseball',
-            'home run', 'strikeout', 'hit', 'world series', 'record',
-            'debut', 'retire', 'no-hitter', 'yankees', 'red sox',
-            'league', 'major league', 'american league', 'national league'
-        ]
+        # Skip navigation and non-content
+        if SKIP_TEXT_RE.search(text_lower):
+            return False
         
-        if not any(indicator in text_lower for indicator in baseball_indicators):
+        # Must contain baseball-related content
+        if not BASEBALL_INDICATOR_RE.search(text_lower):
             return False
         
         # Filter out non-baseball historical events
-        non_baseball_terms = [
-            'earthquake', 'president', 'politics', 'war', 'murder',
-            'execution', 'european union', 'space shuttle', 'olympic'
-        ]
-        
-        if any(term in text_lower for term in non_baseball_terms):
+        if NON_BASEBALL_RE.search(text_lower):
             return False
         
         return True
@@ -279,22 +329,8 @@ class EnhancedMLBScraper:
         """Enhanced event classification with more specific categories"""
         text_lower = text.lower()
         
-        # Priority-based classification (most specific first)
-        classifications = [
-            ('World Series', ['world series', 'championship series', 'swept', 'game 7']),
-            ('No-Hitter', ['no-hitter', 'no-hit', 'perfect game', 'no hitter']),
-            ('Record', ['record', 'first player to', 'first time', 'most', 'fastest', 'longest', 'broke the record', 'set a new', 'all-time']),
-            ('Debut', ['debut', 'first game', 'first appearance', 'rookie', 'first african-american', 'first black player', 'expansion']),
-            ('Retirement', ['retire', 'retirement', 'final game', 'last season', 'announced retirement', 'career ended']),
-            ('Death', ['death', 'died', 'passed away']),
-            ('Award', ['mvp', 'most valuable player', 'cy young', 'rookie of the year', 'hall of fame', 'award']),
-            ('Transaction', ['trade', 'traded', 'acquired', 'signed', 'contract']),
-            ('Rule Change', ['rule', 'designated hitter', 'mound', 'strike zone', 'expansion', 'playoff format']),
-            ('Milestone', ['3000', '500', '400', 'milestone', 'career', 'thousandth'])
-        ]
-        
-        for event_type, keywords in classifications:
-            if any(keyword in text_lower for keyword in keywords):
+        for event_type, pattern in EVENT_CLASSIFICATIONS:
+            if pattern.search(text_lower):
                 return event_type
         
         return 'Notable Event'
@@ -342,11 +378,11 @@ class EnhancedMLBScraper:
             context += " " + first_row.get_text().lower()
         
         # Classify based on context
-        if any(keyword in context for keyword in ['player review', 'hitting', 'batting']) and 'pitcher' not in context:
+        if HITTING_TABLE_RE.search(context) and 'pitcher' not in context:
             return 'hitting'
-        elif any(keyword in context for keyword in ['pitcher review', 'pitching']):
+        elif PITCHING_TABLE_RE.search(context):
             return 'pitching'
-        elif any(keyword in context for keyword in ['standings', 'team', 'wins', 'losses']):
+        elif STANDINGS_TABLE_RE.search(context):
             return 'standings'
         
         return 'unknown'
@@ -377,18 +413,12 @@ class EnhancedMLBScraper:
                         stat_value = float(values[3])
                         
                         if self.is_valid_player_record(player_name, stat_category, stat_value):
-                            data_dict = {
-                                'year': year,
-                                'player_name': player_name,
-                                'team': team,
-                                'stat_category': stat_category,
-                                'stat_value': stat_value
-                            }
+                            record = (year, player_name, team, stat_category, stat_value)
                             
                             if table_type == 'hitting':
-                                self.hitting_data.append(data_dict)
+                                self.hitting_data.append(record)
                             else:
-                                self.pitching_data.append(data_dict)
+                                self.pitching_data.append(record)
                             
                             records_added += 1
                             self.stats['data_points_collected'] += 1
@@ -409,25 +439,14 @@ class EnhancedMLBScraper:
             return False
         
         # Skip obvious non-names
-        skip_terms = ['statistic', 'name', 'team', 'league', 'total', 'average', 'leader']
-        if any(term in name.lower() for term in skip_terms):
+        if NON_NAME_RE.search(name.lower()):
             return False
         
-        # Validate statistical ranges
-        ranges = {
-            'Home Runs': (0, 100),
-            'Batting Average': (0.100, 0.500),
-            'RBI': (0, 200),
-            'ERA': (0.00, 10.00),
-            'Wins': (0, 35),
-            'Strikeouts': (0, 400),
-            'Saves': (0, 70)
-        }
-        
-        if category in ranges:
-            min_val, max_val = ranges[category]
-            if not (min_val <= value <= max_val):
-                return False
+        # Validate statistical ranges (one lookup instead of a membership
+        # test followed by a second fetch)
+        bounds = PLAYER_STAT_RANGES.get(category)
+        if bounds is not None and not (bounds[0] <= value <= bounds[1]):
+            return False
         
         return True
     
@@ -460,13 +479,7 @@ class EnhancedMLBScraper:
                         if abs(total_games - expected_games) <= 12:  # Allow some variance
                             win_pct = wins / total_games
                             
-                            self.standings_data.append({
-                                'year': year,
-                                'team_name': team_name,
-                                'wins': wins,
-                                'losses': losses,
-                                'win_pct': round(win_pct, 3)
-                            })
+                            self.standings_data.append((year, team_name, wins, losses, round(win_pct, 3)))
                             
                             records_added += 1
                             self.stats['data_points_collected'] += 1
@@ -506,26 +519,24 @@ class EnhancedMLBScraper:
         
         # Save with backup
         datasets = [
-            ('yearly_hitting_leaders.csv', self.hitting_data, 
-             ['year', 'player_name', 'team', 'stat_category', 'stat_value']),
-            ('yearly_pitching_leaders.csv', self.pitching_data,
-             ['year', 'player_name', 'team', 'stat_category', 'stat_value']),
-            ('team_standings.csv', self.standings_data,
-             ['year', 'team_name', 'wins', 'losses', 'win_pct']),
-            ('notable_events.csv', self.events_data,
-             ['year', 'description', 'event_type'])
+            ('yearly_hitting_leaders.csv', self.hitting_data, LEADER_COLUMNS),
+            ('yearly_pitching_leaders.csv', self.pitching_data, LEADER_COLUMNS),
+            ('team_standings.csv', self.standings_data, STANDINGS_COLUMNS),
+            ('notable_events.csv', self.events_data, EVENT_COLUMNS)
         ]
         
         for filename, data, columns in datasets:
             filepath = f'data/raw/{filename}'
             
+            # Stream records straight to disk; an empty dataset still gets its header
+            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(columns)
+                writer.writerows(data)
+            
             if data:
-                df = pd.DataFrame(data)
-                df.to_csv(filepath, index=False)
                 logger.info(f"Saved {len(data)} records to {filename}")
             else:
-                # Create empty file with headers
-                pd.DataFrame(columns=columns).to_csv(filepath, index=False)
                 logger.warning(f"Created empty {filename}")
     
     def print_final_stats(self):
@@ -0,0 +1,51 @@
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from db_query import MLBQueryProgram
+
+class PredefinedQueryCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        db_path = os.path.join(tmp_dir.name, 'mlb.db')
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE standings (year INTEGER, team_name TEXT);")
+        conn.execute("INSERT INTO standings VALUES (1927, 'New York Yankees');")
+        conn.commit()
+        conn.close()
+        
+        self.program = MLBQueryProgram(db_path)
+        self.program.predefined_queries = {
+            'ok': {'name': 'Standings', 'query': "SELECT * FROM standings;"},
+            'bad': {'name': 'Broken', 'query': "SELECT * FROM missing_table;"}
+        }
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(self.program.connect())
+        self.addCleanup(self.program.conn.close)
+
+    def run_query(self, key):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.program.run_predefined_query(key)
+        return output.getvalue()
+
+    def test_failed_query_shows_error_again(self):
+        for _ in range(2):
+            self.assertIn("SQL Error: no such table: missing_table", self.run_query('bad'))
+        self.assertEqual(self.program.query_cache, {})
+
+    def test_successful_query_is_cached(self):
+        first = self.run_query('ok')
+        self.assertIn("New York Yankees", first)
+        self.assertEqual(len(self.program.query_cache), 1)
+        self.assertEqual(self.run_query('ok'), first)
+
+if __name__ == '__main__':
+    unittest.main()